@@ -22,6 +22,9 @@ class AudioCacheService {
   /// Maximum cache size in bytes (1 GB). Oldest files are evicted when exceeded.
   static const int maxCacheBytes = 1024 * 1024 * 1024;
 
+  /// Copy buffer size used when stitching chunk WAVs into one cache file.
+  static const int _copyBufferBytes = 1024 * 1024;
+
   /// Initialize the permanent audio directory.
   Future<void> initialize() async {
     final dir = await getApplicationDocumentsDirectory();
@@ -188,6 +191,9 @@ class AudioCacheService {
     final raf = await outFile.open(mode: FileMode.write);
 
     int dataBytes = 0;
+    // One 1 MiB buffer reused for every read — far fewer read/write
+    // syscalls than 64 KB slices, and no fresh Uint8List per read.
+    final buf = Uint8List(_copyBufferBytes);
     try {
       // Reserve header space
       await raf.writeFrom(Uint8List(44));
@@ -203,12 +209,11 @@ class AudioCacheService {
         final inRaf = await f.open(mode: FileMode.read);
         try {
           await inRaf.setPosition(44);
-          const int bufSize = 64 * 1024;
           while (true) {
-            final chunk = await inRaf.read(bufSize);
-            if (chunk.isEmpty) break;
-            await raf.writeFrom(chunk);
-            dataBytes += chunk.length;
+            final n = await inRaf.readInto(buf);
+            if (n == 0) break;
+            await raf.writeFrom(buf, 0, n);
+            dataBytes += n;
           }
         } finally {
           await inRaf.close();
@@ -332,13 +337,15 @@ class AudioCacheService {
     final dir = Directory(_audioDir!);
     if (!await dir.exists()) return;
 
-    // Collect files with their sizes and modification times
-    final List<File> files = [];
+    // Collect files with their sizes and modification times — one stat()
+    // per file, reused by both the sort and the eviction loop below.
+    final files = <({File file, int size, DateTime modified})>[];
     int totalSize = 0;
     await for (final entity in dir.list()) {
       if (entity is File && entity.path.endsWith('.wav')) {
-        files.add(entity);
-        totalSize += await entity.length();
+        final stat = await entity.stat();
+        files.add((file: entity, size: stat.size, modified: stat.modified));
+        totalSize += stat.size;
       }
     }
 
@@ -348,16 +355,15 @@ class AudioCacheService {
         'exceeds limit ${(maxCacheBytes / (1024 * 1024)).toStringAsFixed(0)} MB — evicting');
 
     // Sort oldest first
-    files.sort((a, b) => a.lastModifiedSync().compareTo(b.lastModifiedSync()));
+    files.sort((a, b) => a.modified.compareTo(b.modified));
 
     final target = (maxCacheBytes * 0.8).toInt();
-    for (final file in files) {
+    for (final entry in files) {
       if (totalSize <= target) break;
       try {
-        final len = await file.length();
-        await file.delete();
-        totalSize -= len;
-        debugPrint('AudioCache: Evicted ${p.basename(file.path)}');
+        await entry.file.delete();
+        totalSize -= entry.size;
+        debugPrint('AudioCache: Evicted ${p.basename(entry.file.path)}');
       } catch (_) {}
     }
   }
@@ -294,9 +294,11 @@ class AudioPlayerService {
     return files;
   }
 
+  static final RegExp _chunkNamePattern = RegExp(r'^tts_chunk_(\d+)\.wav$');
+
   static int _indexFromName(String path) {
     final name = p.basename(path);
-    final m = RegExp(r'^tts_chunk_(\d+)\.wav$').firstMatch(name);
+    final m = _chunkNamePattern.firstMatch(name);
     return int.tryParse(m?.group(1) ?? '') ?? 1 << 30;
   }
 
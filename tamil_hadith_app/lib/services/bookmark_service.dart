@@ -56,11 +56,14 @@ class BookmarkService extends ChangeNotifier {
               created_at INTEGER NOT NULL
             )
           ''');
-          // Copy old data — all old bookmarks are from bukhari
+          // Copy old data — all old bookmarks are from bukhari.
+          // Queue every row into one batch so the copy is a single
+          // round-trip inside the upgrade transaction, not one per row.
           final old = await db.query('bookmarks');
+          final batch = db.batch();
           for (final row in old) {
             final num = row['hadith_number'] as int;
-            await db.insert('bookmarks_v2', {
+            batch.insert('bookmarks_v2', {
               'key': 'bukhari_$num',
               'collection': 'bukhari',
               'hadith_number': num,
@@ -70,6 +73,7 @@ class BookmarkService extends ChangeNotifier {
               'created_at': row['created_at'] ?? 0,
             });
           }
+          await batch.commit(noResult: true);
           await db.execute('DROP TABLE IF EXISTS bookmarks');
           await db.execute('ALTER TABLE bookmarks_v2 RENAME TO bookmarks');
         }
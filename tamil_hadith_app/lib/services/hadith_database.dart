@@ -1,5 +1,6 @@
 import 'dart:io';
 
+import 'package:flutter/foundation.dart';
 import 'package:flutter/services.dart';
 import 'package:path/path.dart' as p;
 import 'package:path_provider/path_provider.dart';
@@ -26,6 +27,54 @@ class HadithDatabase {
     }
 
     _db = await openDatabase(dbPath, readOnly: true);
+
+    // One-time index build, gated on user_version so normal cold starts
+    // only pay for a single pragma read on the read-only handle. The
+    // indexes are only an optimisation: if the build fails (low disk,
+    // locked file, I/O error) the app keeps running without them and
+    // retries on the next launch.
+    if (await _db!.getVersion() < _bookIndexesVersion) {
+      await _db!.close();
+      _db = null;
+      try {
+        await _buildBookIndexes(dbPath);
+      } catch (e) {
+        debugPrint('HadithDatabase: index build failed, continuing without: $e');
+      } finally {
+        _db = await openDatabase(dbPath, readOnly: true);
+      }
+    }
+  }
+
+  /// Secondary indexes backing the `WHERE book = ? ORDER BY ...` queries.
+  /// The bundled asset ships without them, so they are built once on the
+  /// local copy after it has been fully written.
+  static const Map<String, String> _bookIndexes = {
+    'idx_bukhari_book_sno': 'bukhari(book, sno)',
+    'idx_sahihmuslim_book_hadithno': 'sahihmuslim(book, hadithno)',
+  };
+
+  /// `PRAGMA user_version` recorded once [_bookIndexes] exist. The asset
+  /// ships at 0; bump this when the index set changes.
+  static const int _bookIndexesVersion = 1;
+
+  /// Build [_bookIndexes] and stamp [_bookIndexesVersion] in one writable
+  /// session and one transaction. Also covers installs whose copy predates
+  /// the indexes.
+  Future<void> _buildBookIndexes(String dbPath) async {
+    final db = await openDatabase(dbPath);
+    try {
+      final batch = db.batch();
+      for (final entry in _bookIndexes.entries) {
+        batch.execute(
+          'CREATE INDEX IF NOT EXISTS ${entry.key} ON ${entry.value}',
+        );
+      }
+      batch.execute('PRAGMA user_version = $_bookIndexesVersion');
+      await batch.commit(noResult: true);
+    } finally {
+      await db.close();
+    }
   }
 
   // ─────────────────────── Book Index ───────────────────────
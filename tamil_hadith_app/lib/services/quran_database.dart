@@ -20,8 +20,11 @@ class QuranDatabase {
     final dbPath = p.join(dir.path, 'tamil_ift.db');
     final tafsirPath = p.join(dir.path, 'tamil_mokhtasar.db');
 
-    await _copyAssetDbIfMissing('assets/db/tamil_ift.db', dbPath);
-    await _copyAssetDbIfMissing('assets/db/tamil_mokhtasar.db', tafsirPath);
+    // Independent files — copy both on first launch concurrently.
+    await Future.wait([
+      _copyAssetDbIfMissing('assets/db/tamil_ift.db', dbPath),
+      _copyAssetDbIfMissing('assets/db/tamil_mokhtasar.db', tafsirPath),
+    ]);
 
     _db = await openDatabase(dbPath, readOnly: true);
     _tafsirDb = await openDatabase(tafsirPath, readOnly: true);
@@ -173,10 +176,13 @@ class QuranDatabase {
       versesBySura.putIfAbsent(verse.sura, () => []).add(verse);
     }
 
-    final tafsirMaps = <int, Map<int, String>>{};
-    for (final sura in versesBySura.keys) {
-      tafsirMaps[sura] = await _getTafsirMapForSura(sura);
-    }
+    // Issue every sura lookup up front so the platform-channel round trips
+    // overlap instead of running back to back; results come back in order.
+    final suras = versesBySura.keys.toList();
+    final maps = await Future.wait(suras.map(_getTafsirMapForSura));
+    final tafsirMaps = <int, Map<int, String>>{
+      for (int i = 0; i < suras.length; i++) suras[i]: maps[i],
+    };
 
     return verses
         .map(
@@ -190,8 +196,12 @@ class QuranDatabase {
     final tafsirDb = _tafsirDb;
     if (tafsirDb == null) return const {};
 
+    // Only the three columns the map needs — ayah_key / group_ayah_key /
+    // ayah_keys would otherwise be decoded and marshalled across the
+    // platform channel for every row and then thrown away.
     final rows = await tafsirDb.query(
       'tafsir',
+      columns: ['from_ayah', 'to_ayah', 'text'],
       where: 'from_ayah LIKE ?',
       whereArgs: ['$sura:%'],
     );
@@ -213,9 +223,11 @@ class QuranDatabase {
 
   int? _parseAyahNumber(String? ayahKey) {
     if (ayahKey == null || ayahKey.isEmpty) return null;
-    final parts = ayahKey.split(':');
-    if (parts.length != 2) return null;
-    return int.tryParse(parts[1]);
+    // "sura:aya" — parse the digits after the single colon in place
+    // rather than splitting into a throwaway list per row.
+    final colon = ayahKey.indexOf(':');
+    if (colon < 0 || ayahKey.indexOf(':', colon + 1) >= 0) return null;
+    return int.tryParse(ayahKey.substring(colon + 1));
   }
 
   void _ensureOpen() {
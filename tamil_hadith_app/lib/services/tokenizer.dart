@@ -10,6 +10,15 @@ class TamilTokenizer {
   final Map<String, int> _charToId = {};
   final Map<int, String> _idToChar = {};
 
+  /// Dense code-unit → token ID table for U+0000–U+0BFF (ASCII, Latin-1
+  /// and the whole Tamil block U+0B80–U+0BFF), with the case-insensitive
+  /// fallback and unknown → space already resolved. Lets [tokenize] index
+  /// an array per character instead of allocating a one-char String and
+  /// doing up to three hash lookups.
+  static const int _tableSize = 0x0C00;
+  final Uint16List _idTable = Uint16List(_tableSize);
+  int _spaceId = blankId;
+
   /// Blank/pad token ID — the pad_token "3" maps to ID 0 in vocab.json
   static const int blankId = 0;
 
@@ -31,17 +40,54 @@ class TamilTokenizer {
   /// Strip invisible Unicode junk that creeps in from PDFs / web scrapes.
   /// Zero-width chars, NBSP, BOM, and directional marks all break the
   /// character→token mapping and cause garbled pronunciation.
+  ///
+  /// Single pass over the code units: invisible marks are dropped, any
+  /// whitespace run (NBSP included) becomes one space, and the result is
+  /// trimmed — replacing eight chained full-string replace passes.
   static String normalize(String text) {
-    return text
-        .replaceAll('\u200C', '')  // zero-width non-joiner
-        .replaceAll('\u200D', '')  // zero-width joiner
-        .replaceAll('\uFEFF', '')  // BOM
-        .replaceAll('\u200B', '')  // zero-width space
-        .replaceAll('\u200E', '')  // LTR mark
-        .replaceAll('\u200F', '')  // RTL mark
-        .replaceAll('\u00A0', ' ') // NBSP → normal space
-        .replaceAll(RegExp(r'\s+'), ' ')
-        .trim();
+    final out = StringBuffer();
+    bool pendingSpace = false;
+    for (final unit in text.codeUnits) {
+      if (_isInvisible(unit)) continue;
+      if (_isWhitespace(unit)) {
+        pendingSpace = out.isNotEmpty;
+        continue;
+      }
+      if (pendingSpace) {
+        out.writeCharCode(0x20);
+        pendingSpace = false;
+      }
+      out.writeCharCode(unit);
+    }
+    final result = out.toString();
+    // String.trim() also strips NEL (U+0085), which `\s` never collapsed;
+    // keep the edge behaviour of the old replace-then-trim chain.
+    if (result.isNotEmpty &&
+        (result.codeUnitAt(0) == 0x85 ||
+            result.codeUnitAt(result.length - 1) == 0x85)) {
+      return result.trim();
+    }
+    return result;
+  }
+
+  /// ZWSP, ZWNJ, ZWJ, LTR/RTL marks (U+200B–U+200F) and BOM.
+  @pragma('vm:prefer-inline')
+  static bool _isInvisible(int unit) =>
+      (unit >= 0x200B && unit <= 0x200F) || unit == 0xFEFF;
+
+  /// Same set as RegExp `\s` (minus BOM, handled above as invisible).
+  @pragma('vm:prefer-inline')
+  static bool _isWhitespace(int unit) {
+    if (unit <= 0x20) return unit == 0x20 || (unit >= 0x09 && unit <= 0x0D);
+    if (unit < 0xA0) return false;
+    return unit == 0xA0 ||
+        unit == 0x1680 ||
+        (unit >= 0x2000 && unit <= 0x200A) ||
+        unit == 0x2028 ||
+        unit == 0x2029 ||
+        unit == 0x202F ||
+        unit == 0x205F ||
+        unit == 0x3000;
   }
 
   /// Load the vocabulary from tokens.txt asset (Flutter main isolate only)
@@ -59,9 +105,9 @@ class TamilTokenizer {
 
   /// Parse vocabulary data from string content.
   void _parseVocab(String data) {
-    final lines = const LineSplitter().convert(data);
-
-    for (final line in lines) {
+    // LineSplitter.split walks the data lazily — no intermediate List of
+    // every line is built just to be iterated once.
+    for (final line in LineSplitter.split(data)) {
       if (line.trim().isEmpty) continue;
       final lastSpace = line.lastIndexOf(' ');
       if (lastSpace == -1) continue;
@@ -76,6 +122,20 @@ class TamilTokenizer {
         _idToChar[id] = token;
       }
     }
+
+    _spaceId = _charToId[' '] ?? blankId;
+    for (int unit = 0; unit < _tableSize; unit++) {
+      _idTable[unit] = _lookupId(String.fromCharCode(unit));
+    }
+  }
+
+  /// Vocab ID for a single character: exact match, then lower/upper case
+  /// (tokens.txt has both A/a → 15), else space so words don't merge.
+  int _lookupId(String char) {
+    return _charToId[char] ??
+        _charToId[char.toLowerCase()] ??
+        _charToId[char.toUpperCase()] ??
+        _spaceId;
   }
 
   /// Tokenize Tamil text into a list of token IDs for VITS
@@ -105,27 +165,15 @@ class TamilTokenizer {
     final cached = _cache[clean];
     if (cached != null) return cached;
 
-    // Step 1: character-level tokenization into a compact Uint16List
-    final spaceId = _charToId[' '] ?? blankId;
+    // Step 1: character-level tokenization into a compact Uint16List.
+    // Tamil/ASCII hit the dense table; anything above U+0BFF falls back
+    // to the vocab map.
     final rawIds = Uint16List(clean.length);
     for (int i = 0; i < clean.length; i++) {
-      final char = clean[i];
-
-      if (_charToId.containsKey(char)) {
-        rawIds[i] = _charToId[char]!;
-      } else {
-        // Try case-insensitive match (tokens.txt has both A/a → 15)
-        final lower = char.toLowerCase();
-        final upper = char.toUpperCase();
-        if (_charToId.containsKey(lower)) {
-          rawIds[i] = _charToId[lower]!;
-        } else if (_charToId.containsKey(upper)) {
-          rawIds[i] = _charToId[upper]!;
-        } else {
-          // Unknown char → space (prevents word-merging artifacts)
-          rawIds[i] = spaceId;
-        }
-      }
+      final unit = clean.codeUnitAt(i);
+      rawIds[i] = unit < _tableSize
+          ? _idTable[unit]
+          : _lookupId(String.fromCharCode(unit));
     }
 
     if (!addBlank) {
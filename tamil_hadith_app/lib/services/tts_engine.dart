@@ -29,7 +29,10 @@ class TtsEngine {
   final TtsIsolateRunner _runner = TtsIsolateRunner();
   final TamilTokenizer _tokenizer = TamilTokenizer();
   bool _isInitialized = false;
-  bool _initializing = false;
+
+  /// The one in-flight / completed load. Model parsing, graph build and the
+  /// native warm-up forward passes happen once per engine lifetime.
+  Future<void>? _initFuture;
 
   bool get isInitialized => _isInitialized;
   bool get isNativeAvailable => _runner.isNativeAvailable;
@@ -40,10 +43,12 @@ class TtsEngine {
   /// 1. Copies tokens.txt from assets to a file (isolate cannot use rootBundle)
   /// 2. Spawns a background isolate that loads the model + tokenizer
   /// 3. Returns when the engine is ready
-  Future<void> initialize() async {
-    if (_isInitialized || _initializing) return;
-    _initializing = true;
+  ///
+  /// Safe to call from every screen: concurrent and repeat callers all
+  /// await the same load instead of returning before the engine is ready.
+  Future<void> initialize() => _initFuture ??= _initialize();
 
+  Future<void> _initialize() async {
     try {
       // Load tokenizer on main isolate too (for vocabSize getter etc.)
       await _tokenizer.load();
@@ -79,8 +84,6 @@ class TtsEngine {
     } catch (e) {
       debugPrint('TTS Engine initialization failed: $e');
       _isInitialized = true;
-    } finally {
-      _initializing = false;
     }
   }
 
@@ -171,5 +174,6 @@ class TtsEngine {
   void dispose() {
     _runner.dispose();
     _isInitialized = false;
+    _initFuture = null;
   }
 }
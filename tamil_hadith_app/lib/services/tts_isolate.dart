@@ -271,6 +271,19 @@ class _TtsWorker {
     'ரழி':  'ரழியல்லாஹு அன்ஹு',
   };
 
+  /// Word-boundary matchers for [_honorificExpansions]. All rule patterns
+  /// below are compiled once per isolate, not on every [_normalizeText] call.
+  static final Map<String, RegExp> _honorificPatterns = {
+    for (final abbr in _honorificExpansions.keys)
+      abbr: RegExp(
+        r'(?<=[\s,;:.!?\u0964]|^)' + RegExp.escape(abbr) + r'(?=[\s,;:.!?\u0964]|$)',
+      ),
+  };
+
+  /// Smart/straight quotes, parentheses and brackets.
+  static final RegExp _unpronounceablePattern =
+      RegExp('[\u2018\u2019\u201C\u201D\'"()\\[\\]]');
+
   // ══════════════════════════════════════════════════════════════
   // 2. ARABIC / ISLAMIC PRONUNCIATION CORRECTIONS
   //    Tamil TTS model mispronounces Arabic-origin words.
@@ -319,6 +332,12 @@ class _TtsWorker {
     'அடுத்து',
   ];
 
+  /// All [_pauseAfterWords] in one alternation — a single scan per chunk
+  /// instead of one regex pass per word. Group 1 is the matched word.
+  static final RegExp _pauseAfterPattern = RegExp(
+    r'(?<=\s|^)(' + _alternation(_pauseAfterWords) + r')\s+(?=[^\s,;:.!?])',
+  );
+
   /// Words before which a comma is inserted (contrast/shift)
   static const List<String> _pauseBeforeWords = [
     'ஆனால்',
@@ -328,6 +347,14 @@ class _TtsWorker {
     'இருப்பினும்',
   ];
 
+  /// The preceding character is a lookbehind (not a consumed group) so a
+  /// match ending in one word never hides an adjacent word from the scan.
+  /// Unlike the old per-word passes, a word repeated back to back now gets
+  /// a comma before each copy: "x ஆனால் ஆனால்" → "x, ஆனால், ஆனால்".
+  static final RegExp _pauseBeforePattern = RegExp(
+    r'(?<=[^\s,;:.!?])\s+(' + _alternation(_pauseBeforeWords) + r')',
+  );
+
   // ══════════════════════════════════════════════════════════════
   // 4. SACRED REFERENCE PAUSES — respectful slight pause before
   //    mentions of Allah, Prophet, Rasool
@@ -341,22 +368,30 @@ class _TtsWorker {
     'ரஸூல்',
   ];
 
+  static final RegExp _sacredPausePattern = RegExp(
+    r'(?<=[அ-ஹொ])\s+(' + _alternation(_sacredWords) + r')(?=\s)',
+  );
+
   // ══════════════════════════════════════════════════════════════
   // 5. WAQF (long pause) PATTERNS — inserted as silence after chunk
   // ══════════════════════════════════════════════════════════════
 
-  static final List<RegExp> _waqfPatterns = [
-    RegExp(r'ஸல்லல்லாஹு அலைஹி வசல்லம்'),  // salawat — respectful pause
-    RegExp(r'ரழியல்லாஹு அன்ஹு'),             // radi allahu anhu
-    RegExp(r'அலைஹிஸ்ஸலாம்'),                  // alaihissalam
-    RegExp(r'என்று நபி\s*ஸல்லல்லாஹு அலைஹி வசல்லம்\s*அவர்கள்'),
-    RegExp(r'நபி\s*ஸல்லல்லாஹு அலைஹி வசல்லம்\s*கூறினார்'),
-    RegExp(r'அல்லாஹுவின் தூதர்.*?கூறினார்'),
-    RegExp(r'என்று அறிவித்தார்'),
-    RegExp(r'என அறிவித்தார்'),
-    RegExp(r'என்று கூறினார்'),
+  /// Matched with plain substring search — linear time, no regex engine.
+  /// The "நபி … ஸல்லல்லாஹு அலைஹி வசல்லம் … அவர்கள்/கூறினார்" variants
+  /// need no entry of their own: they always contain the salawat phrase.
+  static const List<String> _waqfPhrases = [
+    'ஸல்லல்லாஹு அலைஹி வசல்லம்',  // salawat — respectful pause
+    'ரழியல்லாஹு அன்ஹு',             // radi allahu anhu
+    'அலைஹிஸ்ஸலாம்',                  // alaihissalam
+    'என்று அறிவித்தார்',
+    'என அறிவித்தார்',
+    'என்று கூறினார்',
   ];
 
+  /// "அல்லாஹுவின் தூதர் … கூறினார்" — lead phrase, then the verb later on.
+  static const String _waqfMessengerLead = 'அல்லாஹுவின் தூதர்';
+  static const String _waqfMessengerVerb = 'கூறினார்';
+
   /// Variable pause durations — human narration never pauses the exact same
   /// duration twice. Using randomized ranges removes robotic rhythm.
   final Random _rng = Random();
@@ -428,6 +463,10 @@ class _TtsWorker {
     'ஆயிஷா',
   ];
 
+  static final RegExp _arabicNameStopPattern = RegExp(
+    '(' + _alternation(_arabicNameStops) + r')\s+(?=[^\s,;:.!?])',
+  );
+
   // ══════════════════════════════════════════════════════════════
   // 5c. LONG VOWEL ELONGATION
   //     Tamil TTS shortens Arabic long-aa/ee sounds.
@@ -458,6 +497,24 @@ class _TtsWorker {
     'அறிந்துகொள்ளுங்கள்',
   ];
 
+  static final RegExp _emphasisPattern = RegExp(
+    '(' + _alternation(_emphasisWords) + r')\s+(?=[^\s,;:.!?])',
+  );
+
+  /// Regex alternation of literal [words], longest first so a shorter
+  /// word never wins over a longer one sharing its prefix.
+  static String _alternation(List<String> words) {
+    final sorted = [...words]..sort((a, b) => b.length.compareTo(a.length));
+    return sorted.map(RegExp.escape).join('|');
+  }
+
+  /// நபி அவர்கள் not already followed by a pause.
+  static final RegExp _nabiAvargalPattern =
+      RegExp(r'நபி அவர்கள்(?=[^\s,;:.!?]|\s+[^,])');
+
+  static final RegExp _repeatedCommaPattern = RegExp(r',{2,}');
+  static final RegExp _multiSpacePattern = RegExp(r'\s{2,}');
+
   // ══════════════════════════════════════════════════════════════
   // 6. HADITH NUMBER STRIPPING — numbers like "ஹதீஸ் 1234" are noise
   // ══════════════════════════════════════════════════════════════
@@ -613,11 +670,10 @@ class _TtsWorker {
         if (cancelled) break;
 
         final chunk = sentences[i];
-        if (chunk.trim().isEmpty) continue;
-        // ── Guard: skip punctuation-only fragments ──
+        // ── Guard: skip blank and punctuation-only fragments ──
         //    Aggressive comma insertion can create bare "," or "." fragments
         //    that crash or confuse the native VITS engine.
-        if (RegExp(r'^[\s,;:.!?।]+$').hasMatch(chunk.trim())) continue;
+        if (_isBlankOrPunctuation(chunk)) continue;
 
         final chunkTokens = _tokenizeCached(chunk, tokenCache);
         // ── Guard: minimum token threshold ──
@@ -633,18 +689,14 @@ class _TtsWorker {
         // ── Build pre-silence buffer (merged into audio, NOT sent separately) ──
         //    Sending tiny separate chunks causes a race condition in the audio
         //    player where the completion event is lost, stalling playback.
-        final Float32List preSilence;
+        final List<Float32List> preSilence;
         if (isFirstAudioChunk) {
-          preSilence = _roomTone(_paragraphStartMs);
+          preSilence = [_roomTone(_paragraphStartMs)];
         } else if (_containsSacred(chunk)) {
           // Micro pitch reset + sacred pre-delay merged
-          final micro = _roomTone(12);
-          final sacred = _roomTone(_sacredPreDelayMs);
-          preSilence = Float32List(micro.length + sacred.length);
-          preSilence.setRange(0, micro.length, micro);
-          preSilence.setRange(micro.length, preSilence.length, sacred);
+          preSilence = [_roomTone(12), _roomTone(_sacredPreDelayMs)];
         } else {
-          preSilence = _roomTone(12); // micro pitch reset only
+          preSilence = [_roomTone(12)]; // micro pitch reset only
         }
 
         // ── Synthesize with native FFI (guarded against crashes) ──
@@ -684,7 +736,7 @@ class _TtsWorker {
         final tailLen = min(_crossfadeSamples, trimmed.length);
         prevTail = Float32List.sublistView(trimmed, trimmed.length - tailLen);
 
-        Float32List emitAudio;
+        final Float32List emitAudio;
         if (i < sentences.length - 1 && trimmed.length > tailLen) {
           emitAudio = Float32List.sublistView(trimmed, 0, trimmed.length - tailLen);
         } else {
@@ -692,29 +744,40 @@ class _TtsWorker {
         }
 
         // ── Post-chunk pause hierarchy (variable durations) ──
+        int postSilenceMs = 0;
         if (_shouldInsertWaqf(chunk)) {
-          emitAudio = _appendSilence(emitAudio, _waqfPauseFor(chunk));
+          postSilenceMs += _waqfPauseFor(chunk);
         } else if (i < sentences.length - 1) {
           final trimEnd = chunk.trimRight();
           if (trimEnd.endsWith(',') || trimEnd.endsWith(';')) {
-            emitAudio = _appendSilence(emitAudio, _commaGapMs);
+            postSilenceMs += _commaGapMs;
           } else {
-            emitAudio = _appendSilence(emitAudio, _sentenceGapMs);
+            postSilenceMs += _sentenceGapMs;
           }
         }
 
         // ── Long-chunk breathing: narrator inhale after >4s of speech ──
         if (trimmed.length > _sampleRate * 4) {
-          emitAudio = _appendSilence(emitAudio, _longChunkBreathMs);
+          postSilenceMs += _longChunkBreathMs;
         }
 
-        // ── Prepend pre-silence into the audio (one chunk = one WAV file) ──
-        final combined = Float32List(preSilence.length + emitAudio.length);
-        combined.setRange(0, preSilence.length, preSilence);
-        combined.setRange(preSilence.length, combined.length, emitAudio);
-        emitAudio = combined;
+        // ── Assemble pre-silence + speech + pauses (one chunk = one WAV file) ──
+        //    Sized up front and filled once, instead of re-allocating and
+        //    re-copying the whole chunk for every pause appended.
+        final postSamples = (_sampleRate * postSilenceMs / 1000).toInt();
+        final preSamples = preSilence.fold<int>(0, (n, b) => n + b.length);
+        final combined =
+            Float32List(preSamples + emitAudio.length + postSamples);
+        int offset = 0;
+        for (final part in preSilence) {
+          combined.setRange(offset, offset + part.length, part);
+          offset += part.length;
+        }
+        combined.setRange(offset, offset + emitAudio.length, emitAudio);
+        offset += emitAudio.length;
+        _fillRoomTone(combined, offset, postSamples);
 
-        _mainPort.send(TtsChunk(requestId, emitAudio));
+        _mainPort.send(TtsChunk(requestId, combined));
       }
 
       prevTail = null;
@@ -737,56 +800,65 @@ class _TtsWorker {
   //   9. Final whitespace collapse
   // ══════════════════════════════════════════════════════════════
 
+  static const Map<String, String> _doublePunctuation = {
+    '..': '.',
+    ',,': ',',
+    '!!': '!',
+    '??': '?',
+    ';;': ';',
+    '::': ':',
+  };
+
+  // Literal replaces and single-trigger regex rules are gated on a cheap
+  // substring check: most chunks contain none of the trigger words, and a
+  // `contains` miss is far cheaper than a regex scan that finds nothing.
+  // The multi-word families (steps 7, 8, 9, 11) are not gated; each is a
+  // single alternation pass over the chunk instead.
   String _normalizeText(String text) {
     // 1. Unicode cleanup (strip zero-width chars, NBSP, etc.)
     String s = TamilTokenizer.normalize(text);
 
     // 2. Double-punctuation normalization — prevent stutter
-    s = s.replaceAll('..', '.');
-    s = s.replaceAll(',,', ',');
-    s = s.replaceAll('!!', '!');
-    s = s.replaceAll('??', '?');
-    s = s.replaceAll(';;', ';');
-    s = s.replaceAll('::',':');
+    for (final entry in _doublePunctuation.entries) {
+      if (s.contains(entry.key)) s = s.replaceAll(entry.key, entry.value);
+    }
 
     // 3. Strip hadith reference numbers (noise for TTS)
-    s = s.replaceAll(_hadithNumPattern, '');
+    if (s.contains('ஹதீ') || s.contains('எண்')) {
+      s = s.replaceAll(_hadithNumPattern, '');
+    }
 
     // 4. Expand parenthesized abbreviations: நபி(ஸல்) → நபி ஸல்லல்லாஹு அலைஹி வசல்லம்
-    s = s.replaceAllMapped(_parenAbbrevPattern, (m) {
-      final abbr = m.group(1)!;
-      final expansion = _honorificExpansions[abbr] ?? abbr;
-      return ' $expansion';
-    });
+    if (s.contains('(')) {
+      s = s.replaceAllMapped(_parenAbbrevPattern, (m) {
+        final abbr = m.group(1)!;
+        final expansion = _honorificExpansions[abbr] ?? abbr;
+        return ' $expansion';
+      });
+    }
 
     // Expand standalone abbreviations (word-boundary aware)
     for (final entry in _honorificExpansions.entries) {
-      final pattern = RegExp(
-        r'(?<=[\s,;:.!?\u0964]|^)' + RegExp.escape(entry.key) + r'(?=[\s,;:.!?\u0964]|$)',
-      );
-      s = s.replaceAll(pattern, entry.value);
+      if (!s.contains(entry.key)) continue;
+      s = s.replaceAll(_honorificPatterns[entry.key]!, entry.value);
     }
 
     // 4b. Strip non-pronounceable characters remaining after abbreviation expansion
     //     Quotes and parentheses are not in the Tamil VITS vocabulary;
     //     they tokenize as spaces and waste tokens.
-    s = s
-        .replaceAll('\u2018', '').replaceAll('\u2019', '')  // smart single quotes
-        .replaceAll('\u201C', '').replaceAll('\u201D', '')  // smart double quotes
-        .replaceAll("'", '').replaceAll('"', '')            // straight quotes
-        .replaceAll('(', '').replaceAll(')', '')            // parentheses
-        .replaceAll('[', '').replaceAll(']', '');           // brackets
+    //     One character-class pass instead of ten single-char replaces.
+    s = s.replaceAll(_unpronounceablePattern, '');
 
     // 5. Arabic / Islamic pronunciation corrections
     for (final entry in _pronunciationFixes.entries) {
-      s = s.replaceAll(entry.key, entry.value);
+      if (s.contains(entry.key)) s = s.replaceAll(entry.key, entry.value);
     }
 
     // 5b. Long-aa vowel elongation — sustain Arabic vowels
     //     Duplicate vowel sign so VITS holds the sound longer.
     //     Apply only ONCE per word to prevent sing-song over-stretching.
     for (final entry in _longVowelFixes.entries) {
-      s = s.replaceAll(entry.key, entry.value);
+      if (s.contains(entry.key)) s = s.replaceAll(entry.key, entry.value);
     }
 
     // 6. Number → Tamil words (1–9999)
@@ -796,61 +868,36 @@ class _TtsWorker {
     //    AFTER narration words: கூறினார்கள் → கூறினார்கள்,
     //    IMPORTANT: requires whitespace on BOTH sides to prevent matching
     //    a short word inside a longer one (e.g. "கூறினார்" inside "கூறினார்கள்").
-    for (final word in _pauseAfterWords) {
-      s = s.replaceAllMapped(
-        RegExp(r'(?<=\s|^)' + RegExp.escape(word) + r'\s+(?=[^\s,;:.!?])'),
-        (m) => '$word, ',
-      );
-    }
+    s = s.replaceAllMapped(_pauseAfterPattern, (m) => '${m.group(1)}, ');
 
     //    BEFORE contrast words: ...text ஆனால் → ...text, ஆனால்
-    for (final word in _pauseBeforeWords) {
-      // Add comma before if not already preceded by punctuation
-      s = s.replaceAllMapped(
-        RegExp(r'([^\s,;:.!?])\s+' + RegExp.escape(word)),
-        (m) => '${m.group(1)}, $word',
-      );
-    }
+    //    (only if not already preceded by punctuation)
+    s = s.replaceAllMapped(_pauseBeforePattern, (m) => ', ${m.group(1)}');
 
     // 8. Sacred reference pauses — slight comma before Allah/Nabi/Rasool
-    for (final word in _sacredWords) {
-      // Add comma before sacred word if preceded by a regular word (not punctuation)
-      s = s.replaceAllMapped(
-        RegExp(r'([அ-ஹொ])\s+' + RegExp.escape(word) + r'(?=\s)'),
-        (m) => '${m.group(1)}, $word',
-      );
-    }
+    //    Only when preceded by a regular word (not punctuation)
+    s = s.replaceAllMapped(_sacredPausePattern, (m) => ', ${m.group(1)}');
 
     // 9. Arabic name consonant stops — comma after to prevent trailing "உ"
     //    VITS adds epenthetic vowel after virama-ending Arabic names;
     //    a comma forces a prosodic boundary that cleanly stops the consonant.
-    for (final name in _arabicNameStops) {
-      s = s.replaceAllMapped(
-        RegExp(RegExp.escape(name) + r'\s+(?=[^\s,;:.!?])'),
-        (m) => '$name, ',
-      );
-    }
+    s = s.replaceAllMapped(_arabicNameStopPattern, (m) => '${m.group(1)}, ');
 
     // 10. நபி அவர்கள் respectful pause — slow narration for Prophet reference
-    s = s.replaceAllMapped(
-      RegExp(r'நபி அவர்கள்(?=[^\s,;:.!?]|\s+[^,])'),
-      (m) => 'நபி அவர்கள்,',
-    );
+    if (s.contains('நபி அவர்கள்')) {
+      s = s.replaceAll(_nabiAvargalPattern, 'நபி அவர்கள்,');
+    }
 
     // 11. Emphasis words — add comma for stress in narration
-    for (final word in _emphasisWords) {
-      s = s.replaceAllMapped(
-        RegExp(RegExp.escape(word) + r'\s+(?=[^\s,;:.!?])'),
-        (m) => '$word, ',
-      );
-    }
+    s = s.replaceAllMapped(_emphasisPattern, (m) => '${m.group(1)}, ');
 
     // 12. Safety: collapse consecutive commas that earlier steps may create
     //     (pause-after + sacred comma can produce ",," which breaks splitting)
-    s = s.replaceAll(RegExp(r',{2,}'), ',');
+    if (s.contains(',,')) s = s.replaceAll(_repeatedCommaPattern, ',');
 
     // 13. Final whitespace collapse
-    s = s.replaceAll(RegExp(r'\s{2,}'), ' ').trim();
+    if (s.contains('  ')) s = s.replaceAll(_multiSpacePattern, ' ');
+    s = s.trim();
 
     return s;
   }
@@ -863,13 +910,12 @@ class _TtsWorker {
   ) {
     // Step 1: split on sentence-ending punctuation and colons
     //   Colon is a primary split because hadith text uses "X கூறினார்:" pattern
-    final raw = text.split(RegExp(r'(?<=[.!?।:\n])\s*'));
+    final raw = _splitAfter(text, _isSentenceEnd);
     final List<String> result = [];
 
     for (final sentence in raw) {
-      if (sentence.trim().isEmpty) continue;
-      // Skip punctuation-only fragments from comma insertion
-      if (RegExp(r'^[\s,;:.!?।]+$').hasMatch(sentence.trim())) continue;
+      // Skip blank / punctuation-only fragments from comma insertion
+      if (_isBlankOrPunctuation(sentence)) continue;
       final tokens = _tokenizeCached(sentence, tokenCache);
       if (tokens.length <= _maxTokensPerChunk) {
         result.add(sentence);
@@ -877,7 +923,7 @@ class _TtsWorker {
       }
 
       // Step 2: split long sentences on commas / semicolons / colons
-      final parts = sentence.split(RegExp(r'(?<=[,;:])\s*'));
+      final parts = _splitAfter(sentence, _isClauseEnd);
       final StringBuffer buf = StringBuffer();
       int bufTokens = 0;
       for (final part in parts) {
@@ -904,6 +950,55 @@ class _TtsWorker {
     return result;
   }
 
+  /// Cut [text] after every code unit accepted by [isBoundary], dropping
+  /// the whitespace that follows each cut. One left-to-right scan that
+  /// slices the pieces directly (no regex, no per-piece re-matching).
+  ///
+  /// Force-inlined so AOT sees the constant [isBoundary] tear-off at each
+  /// call site and can inline it too, instead of a closure call per char.
+  @pragma('vm:prefer-inline')
+  static List<String> _splitAfter(String text, bool Function(int) isBoundary) {
+    final pieces = <String>[];
+    final n = text.length;
+    int start = 0;
+    int i = 0;
+    while (i < n) {
+      if (!isBoundary(text.codeUnitAt(i++))) continue;
+      pieces.add(text.substring(start, i));
+      while (i < n && _isSpace(text.codeUnitAt(i))) {
+        i++;
+      }
+      start = i;
+    }
+    if (start < n) pieces.add(text.substring(start));
+    return pieces;
+  }
+
+  /// `. ! ? । :` and newline — colon is a primary split because hadith
+  /// text uses the "X கூறினார்:" pattern.
+  @pragma('vm:prefer-inline')
+  static bool _isSentenceEnd(int c) =>
+      c == 0x2E || c == 0x21 || c == 0x3F || c == 0x0964 ||
+      c == 0x3A || c == 0x0A;
+
+  /// `, ; :`
+  @pragma('vm:prefer-inline')
+  static bool _isClauseEnd(int c) => c == 0x2C || c == 0x3B || c == 0x3A;
+
+  @pragma('vm:prefer-inline')
+  static bool _isSpace(int c) => c == 0x20 || (c >= 0x09 && c <= 0x0D);
+
+  /// True when [text] holds nothing but whitespace and `, ; : . ! ? ।`.
+  static bool _isBlankOrPunctuation(String text) {
+    for (int i = 0; i < text.length; i++) {
+      final c = text.codeUnitAt(i);
+      if (!_isSpace(c) && !_isClauseEnd(c) && !_isSentenceEnd(c)) {
+        return false;
+      }
+    }
+    return true;
+  }
+
   /// Final fallback: split text on spaces to stay within chunk limit.
   void _splitByWords(
     String text,
@@ -948,9 +1043,9 @@ class _TtsWorker {
       _inputPtrLen = len + 64; // over-allocate slightly to avoid frequent reallocs
       _inputPtr = calloc<Int32>(_inputPtrLen);
     }
-    for (int i = 0; i < len; i++) {
-      _inputPtr![i] = tokenIds[i];
-    }
+    // One bulk copy into native memory through a typed view, rather than a
+    // per-token pointer store.
+    _inputPtr!.asTypedList(len).setRange(0, len, tokenIds);
 
     final result = _bindings!.synthesize(
       engine, _inputPtr!, len,
@@ -987,10 +1082,12 @@ class _TtsWorker {
   }
 
   bool _shouldInsertWaqf(String text) {
-    for (final pattern in _waqfPatterns) {
-      if (pattern.hasMatch(text)) return true;
+    for (final phrase in _waqfPhrases) {
+      if (text.contains(phrase)) return true;
     }
-    return false;
+    final lead = text.indexOf(_waqfMessengerLead);
+    return lead >= 0 &&
+        text.indexOf(_waqfMessengerVerb, lead + _waqfMessengerLead.length) >= 0;
   }
 
   /// Generate ultra-low room ambience (~−55 dB white noise).
@@ -1001,9 +1098,7 @@ class _TtsWorker {
     if (samples >= _roomToneBufLen) {
       // Rare: very long pause — tile from pre-computed buffer
       final out = Float32List(samples);
-      for (int i = 0; i < samples; i++) {
-        out[i] = _roomToneBuf[i % _roomToneBufLen];
-      }
+      _fillRoomTone(out, 0, samples);
       return out;
     }
     // Fast path: slice from a random offset in the pre-computed buffer
@@ -1012,16 +1107,16 @@ class _TtsWorker {
     return Float32List.sublistView(_roomToneBuf, start, start + samples);
   }
 
-  Float32List _appendSilence(Float32List audio, int ms) {
-    final silenceSamples = (_sampleRate * ms / 1000).toInt();
-    if (silenceSamples <= 0) return audio;
-    final result = Float32List(audio.length + silenceSamples);
-    result.setRange(0, audio.length, audio);
-    // Fill silence from pre-computed room tone buffer
-    for (int i = 0; i < silenceSamples; i++) {
-      result[audio.length + i] = _roomToneBuf[i % _roomToneBufLen];
+  /// Write [count] samples of room tone into [out] starting at [start].
+  /// Tiles whole buffer-sized blocks with setRange (a memcpy) instead of a
+  /// per-sample modulo loop.
+  void _fillRoomTone(Float32List out, int start, int count) {
+    final end = start + count;
+    while (start < end) {
+      final n = min(end - start, _roomToneBufLen);
+      out.setRange(start, start + n, _roomToneBuf);
+      start += n;
     }
-    return result;
   }
 
   /// Destroy the native MNN engine and free all pre-allocated FFI pointers.
@@ -0,0 +1,130 @@
+import 'dart:io';
+
+import 'package:flutter_test/flutter_test.dart';
+import 'package:tamil_hadith_audio/services/tokenizer.dart';
+
+/// The replace/regex/trim chain [TamilTokenizer.normalize] replaced.
+/// The single-pass version must produce identical output.
+String _referenceNormalize(String text) {
+  return text
+      .replaceAll('\u200C', '')
+      .replaceAll('\u200D', '')
+      .replaceAll('\uFEFF', '')
+      .replaceAll('\u200B', '')
+      .replaceAll('\u200E', '')
+      .replaceAll('\u200F', '')
+      .replaceAll('\u00A0', ' ')
+      .replaceAll(RegExp(r'\s+'), ' ')
+      .trim();
+}
+
+/// The per-character map lookup the dense `_idTable` in
+/// [TamilTokenizer.tokenize] replaced: exact, lower, upper, else space,
+/// with blanks interleaved.
+List<int> _referenceTokenize(Map<String, int> vocab, String text) {
+  final clean = TamilTokenizer.normalize(text);
+  final spaceId = vocab[' '] ?? TamilTokenizer.blankId;
+  final ids = <int>[TamilTokenizer.blankId];
+  for (int i = 0; i < clean.length; i++) {
+    final char = clean[i];
+    ids.add(vocab[char] ??
+        vocab[char.toLowerCase()] ??
+        vocab[char.toUpperCase()] ??
+        spaceId);
+    ids.add(TamilTokenizer.blankId);
+  }
+  return ids;
+}
+
+Map<String, int> _readVocab(String path) {
+  final vocab = <String, int>{};
+  for (final line in File(path).readAsLinesSync()) {
+    final lastSpace = line.lastIndexOf(' ');
+    if (line.trim().isEmpty || lastSpace == -1) continue;
+    final id = int.tryParse(line.substring(lastSpace + 1).trim());
+    if (id != null) vocab[line.substring(0, lastSpace)] = id;
+  }
+  return vocab;
+}
+
+void main() {
+  group('TamilTokenizer.normalize', () {
+    void expectSameAsReference(String input, String expected) {
+      expect(TamilTokenizer.normalize(input), expected);
+      expect(TamilTokenizer.normalize(input), _referenceNormalize(input));
+    }
+
+    test('removes zero-width characters, directional marks and BOM', () {
+      expectSameAsReference(
+        '\uFEFFநபி\u200B(ஸல்)\u200C அவர்கள்\u200D\u200E கூறினார்\u200F',
+        'நபி(ஸல்) அவர்கள் கூறினார்',
+      );
+    });
+
+    test('collapses NBSP and mixed whitespace runs to one space', () {
+      expectSameAsReference('அல்லாஹ்\u00A0\u00A0தூதர்', 'அல்லாஹ் தூதர்');
+      expectSameAsReference('ஒன்று \t\n\r இரண்டு\n\nமூன்று', 'ஒன்று இரண்டு மூன்று');
+      expectSameAsReference('a\u3000\u2003b\u202F\u205Fc', 'a b c');
+    });
+
+    test('a whitespace run broken only by invisible marks stays one space', () {
+      expectSameAsReference('a \u200B \u200D\tb', 'a b');
+    });
+
+    test('trims leading and trailing whitespace', () {
+      expectSameAsReference('  \t\nஹதீஸ்\u00A0 \n', 'ஹதீஸ்');
+      expectSameAsReference('\u200B \u00A0\uFEFF', '');
+      expectSameAsReference('', '');
+    });
+
+    test('trims NEL (U+0085) at the edges but keeps it inside', () {
+      expectSameAsReference('\u0085 a \u0085', 'a');
+      expectSameAsReference('a\u0085b', 'a\u0085b');
+      expectSameAsReference('a \u0085 b', 'a \u0085 b');
+    });
+  });
+
+  group('TamilTokenizer.tokenize', () {
+    const tokensPath = 'assets/models/tokens.txt';
+    late TamilTokenizer tokenizer;
+    late Map<String, int> vocab;
+
+    setUpAll(() {
+      tokenizer = TamilTokenizer()..loadFromFile(tokensPath);
+      vocab = _readVocab(tokensPath);
+    });
+
+    void expectSameAsReference(String input) {
+      expect(tokenizer.tokenize(input), _referenceTokenize(vocab, input),
+          reason: 'input: ${input.codeUnits}');
+    }
+
+    test('ASCII upper and lower case share an ID', () {
+      expectSameAsReference('A');
+      expectSameAsReference('a');
+      expect(tokenizer.tokenize('A'), tokenizer.tokenize('a'));
+      expectSameAsReference("Aa 7_'");
+    });
+
+    test('Tamil text', () {
+      expectSameAsReference('நபி (ஸல்) அவர்கள் கூறினார்கள்: ஹதீஸ் 2');
+    });
+
+    test('Latin-1 and unknown characters map to space', () {
+      expectSameAsReference('é É ß ÿ');
+      expectSameAsReference('x#b?Q');
+      expect(tokenizer.tokenize('#')[1], vocab[' ']);
+    });
+
+    test('characters above U+0BFF use the map fallback', () {
+      expectSameAsReference('க\u0C05அ\u20AC');
+      expectSameAsReference('நபி \u{1F600} அ');
+    });
+
+    test('every code unit in the dense table range', () {
+      for (int unit = 0; unit < 0x0C10; unit++) {
+        expectSameAsReference('a${String.fromCharCode(unit)}a');
+      }
+    });
+  });
+}